@@ -1,12 +1,70 @@
 import os
 
 from setuptools import find_packages, setup
+from setuptools.command.build_ext import build_ext
 
 dpath = os.path.dirname(os.path.realpath(__file__))
 with open(os.path.join(dpath, "README.md"), "r") as f:
     long_description = f.read()
 
 
+# The modules that are compiled to C extensions when a compiler is available. ast.py
+# stays pure Python, so that the AST classes remain ordinary attrs classes.
+COMPILED_MODULES = ["sqliteparser/parser.py", "sqliteparser/lexer.py"]
+
+
+def compiled_extensions():
+    """
+    Compiles the parser and lexer to C extensions with mypyc or, if mypyc is not
+    installed, with Cython.
+
+    If mypyc rejects the modules, Cython is tried instead, and if the extensions then
+    fail to build, the pure-Python modules are installed (see ``OptionalBuildExt``).
+    Set ``SQLITEPARSER_PURE_PYTHON=1`` to skip compilation altogether.
+    """
+    if os.environ.get("SQLITEPARSER_PURE_PYTHON"):
+        return []
+
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        pass
+    else:
+        try:
+            return mypycify(COMPILED_MODULES)
+        except (Exception, SystemExit):
+            # mypyc type-checks the modules first and exits if a given version of mypy
+            # reports an error, so fall through to Cython or to pure Python instead.
+            pass
+
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+
+    return cythonize(COMPILED_MODULES, language_level=3)
+
+
+class OptionalBuildExt(build_ext):
+    """
+    Builds the C extensions, or none of them if any one fails.
+
+    Marking each extension as optional is not enough: mypyc builds a small extension
+    per module that imports one shared extension, so if only the shared one fails,
+    the others would shadow the pure-Python modules and then fail to import.
+    """
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            print(f"warning: building the C extensions failed, using pure Python: {e}")
+            for extension in self.extensions:
+                path = self.get_ext_fullpath(extension.name)
+                if os.path.exists(path):
+                    os.remove(path)
+
+
 setup(
     name="sqliteparser",
     version="0.6.1",
@@ -17,6 +75,8 @@ setup(
     author="Ian Fisher",
     author_email="iafisher@fastmail.com",
     packages=find_packages(exclude=["tests"]),
+    ext_modules=compiled_extensions(),
+    cmdclass={"build_ext": OptionalBuildExt},
     install_requires=["attrs >= 20.3.0"],
     project_urls={"Source": "https://github.com/iafisher/sqliteparser"},
     classifiers=[
@@ -1,4 +1,11 @@
+from importlib.machinery import EXTENSION_SUFFIXES
+
 from . import ast
+from . import parser as _parser
 from .exceptions import SQLiteParserError, SQLiteParserImpossibleError
 from .parser import parse, parse_column
 from .utils import quote
+
+# Whether the parser is running as a C extension built by setup.py, rather than as the
+# pure-Python module that it falls back to.
+COMPILED = (_parser.__file__ or "").endswith(tuple(EXTENSION_SUFFIXES))
@@ -99,6 +99,10 @@ class Operation(StringEnum):
             return super().__str__()
 
 class Node(ABC):
+    # Subclasses are slotted attrs classes, so the base classes must not add a
+    # per-instance __dict__ either.
+    __slots__ = ()
+
     def accept(self, visitor):
         """
         Accept a visitor implementing the visitor pattern.
@@ -145,14 +149,14 @@ class Node(ABC):
 
 
 class BaseConstraint(Node):
-    pass
+    __slots__ = ()
 
 
 class Expression(Node):
-    pass
+    __slots__ = ()
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class CreateTableStatement(Node):
     """
     A SQL ``CREATE TABLE`` statement.
@@ -207,19 +211,19 @@ class CreateTableStatement(Node):
 
         return "".join(builder)
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class CreateIndexStatement(Node):
     """
     A SQL ``CREATE INDEX`` statement.
     """
     name: Union[str, "TableName"]
     table:Union[str, "TableName"]
-    columns: List["Column"]
+    columns: List[str]
     if_not_exists: bool = False
     unique: bool = False
-    where:Expression = None
+    where: Optional[Expression] = None
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class CreateVirtualTableStatement(Node):
     """
     A SQL ``CREATE VIRTUAL TABLE`` statement.
@@ -229,7 +233,7 @@ class CreateVirtualTableStatement(Node):
     arguments:Optional[List[str]]
     if_not_exists: bool = False
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class CreateTriggerStatement(Node):
     """
     A SQL ``CREATE TRIGGER`` statement.
@@ -243,7 +247,7 @@ class CreateTriggerStatement(Node):
     if_not_exists: bool = False
   
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class CreateViewStatement(Node):
     """
     A SQL ``CREATE VIEW`` statement.
@@ -258,7 +262,7 @@ class CreateViewStatement(Node):
 
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class SelectStatement(Node):
     """
     A SQL ``SELECT`` statement.
@@ -270,7 +274,7 @@ class SelectStatement(Node):
         raise NotImplementedError
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class Column(Node):
     name: str
     definition: Optional["ColumnDefinition"]
@@ -283,7 +287,7 @@ class Column(Node):
             return f"{quote(self.name)} {definition}"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class ColumnType(Node):
     name: str
     args: List[int]
@@ -293,10 +297,10 @@ class ColumnType(Node):
         return f"{quote(self.name)}({joined_args})"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class ColumnDefinition(Node):
     type: Optional[Union[ColumnType, str]] = None
-    default: Optional[Expression] = None
+    default: Optional[Union[DefaultValue, Expression]] = None
     constraints: List[BaseConstraint] = Factory(list)
 
     def as_string(self, *, p: bool) -> str:
@@ -316,7 +320,7 @@ class ColumnDefinition(Node):
         return "".join(builder)
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class CheckConstraint(BaseConstraint):
     expr: Expression
 
@@ -325,7 +329,7 @@ class CheckConstraint(BaseConstraint):
         return f"CHECK({e})"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class NamedConstraint(BaseConstraint):
     name: str
     constraint: BaseConstraint
@@ -334,7 +338,7 @@ class NamedConstraint(BaseConstraint):
         return f"CONSTRAINT {quote(self.name)} {self.constraint}"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class NotNullConstraint(BaseConstraint):
     on_conflict: Optional[OnConflict] = None
 
@@ -345,7 +349,7 @@ class NotNullConstraint(BaseConstraint):
             return "NOT NULL"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class PrimaryKeyConstraint(BaseConstraint):
     # NOTE: This is for a PRIMARY KEY constraint on a single column. For a multi-
     # column table-level constraint, see PrimaryKeyTableConstraint.
@@ -371,7 +375,7 @@ class PrimaryKeyConstraint(BaseConstraint):
         return "".join(builder)
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class PrimaryKeyTableConstraint(BaseConstraint):
     # NOTE: This is for a table-level PRIMARY KEY constraint. For a constraint on an
     # individual column, see PrimaryKeyConstraint.
@@ -392,7 +396,7 @@ class PrimaryKeyTableConstraint(BaseConstraint):
 
         return "".join(builder)
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class UniqueTableConstraint(BaseConstraint):
     # NOTE: This is for a table-level PRIMARY KEY constraint. For a constraint on an
     # individual column, see PrimaryKeyConstraint.
@@ -416,7 +420,7 @@ class UniqueTableConstraint(BaseConstraint):
 
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class CollateConstraint(BaseConstraint):
     sequence: CollatingSequence
 
@@ -424,7 +428,7 @@ class CollateConstraint(BaseConstraint):
         return f"COLLATE {self.sequence}"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class ForeignKeyConstraint(BaseConstraint):
     columns: List[str]
     foreign_table: str
@@ -471,7 +475,7 @@ class ForeignKeyConstraint(BaseConstraint):
         return "".join(builder)
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class UniqueConstraint(BaseConstraint):
     on_conflict: Optional[OnConflict] = None
 
@@ -482,7 +486,7 @@ class UniqueConstraint(BaseConstraint):
             return "UNIQUE"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class GeneratedColumnConstraint(BaseConstraint):
     expression: Expression
     storage: Optional[GeneratedColumnStorage] = None
@@ -493,7 +497,7 @@ class GeneratedColumnConstraint(BaseConstraint):
         return f"GENERATED ALWAYS AS ({e}){storage_string}"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class Infix(Expression):
     operator: str
     left: Expression
@@ -506,7 +510,24 @@ class Infix(Expression):
         return f"({core})" if p else core
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
+class InfixList(Expression):
+    """
+    A chain of three or more operands joined by the same associative operator, e.g.
+    ``a OR b OR c``.
+    """
+
+    operator: str
+    operands: List[Expression]
+
+    def as_string(self, *, p: bool) -> str:
+        core = f" {self.operator} ".join(
+            operand.as_string(p=True) for operand in self.operands
+        )
+        return f"({core})" if p else core
+
+
+@attrs(auto_attribs=True, slots=True)
 class Call(Expression):
     function: "Identifier"
     arguments: List[Expression]
@@ -526,7 +547,7 @@ class Call(Expression):
         return f"{function_string}({arguments_string})"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class ExpressionList(Expression):
     values: List[Expression]
 
@@ -534,7 +555,7 @@ class ExpressionList(Expression):
         return "(" + ", ".join(v.as_string(p=False) for v in self.values) + ")"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class Identifier(Expression):
     value: str
 
@@ -542,7 +563,7 @@ class Identifier(Expression):
         return quote(self.value)
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class String(Expression):
     value: str
 
@@ -551,7 +572,7 @@ class String(Expression):
         return f"'{escaped}'"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class Blob(Expression):
     value: bytes
 
@@ -559,7 +580,7 @@ class Blob(Expression):
         return "X'" + "".join(f"{hex(b)[2:]:0>2}" for b in self.value) + "'"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class Integer(Expression):
     value: int
 
@@ -567,13 +588,13 @@ class Integer(Expression):
         return str(self.value)
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class Null(Expression):
     def as_string(self, *, p: bool) -> str:
         return "NULL"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class Boolean(Expression):
     value: bool
 
@@ -581,7 +602,7 @@ class Boolean(Expression):
         return "TRUE" if self.value else "FALSE"
 
 
-@attrs(auto_attribs=True)
+@attrs(auto_attribs=True, slots=True)
 class TableName(Node):
     schema_name: str
     table_name: str
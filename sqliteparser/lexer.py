@@ -1,13 +1,13 @@
 import enum
 import string
-from typing import Any, List, Optional, Tuple, Union
-
-from attr import attrs
+import sys
+from array import array
+from typing import AbstractSet, Any, List, Optional, Tuple, Union
 
 from .exceptions import SQLiteParserError
 
 
-class TokenType(enum.Enum):
+class TokenType(enum.IntEnum):
     KEYWORD = enum.auto()
     IDENTIFIER = enum.auto()
     LEFT_PARENTHESIS = enum.auto()
@@ -28,103 +28,165 @@ class TokenType(enum.Enum):
     UNKNOWN = enum.auto()
 
 
-@attrs(auto_attribs=True)
-class Token:
-    type: TokenType
-    value: Any
-    line: int
-    column: int
-    # Use to preserve the case of identifiers that also happen to be keywords.
-    original_value: Optional[str] = None
-
+CheckTokenType = AbstractSet[Union[str, TokenType, Tuple[TokenType, str]]]
 
-CheckTokenType = List[Union[str, TokenType, Tuple[TokenType, str]]]
+# The (type, value) pair of a token, as returned by Lexer.current and Lexer.advance.
+TokenPair = Tuple[int, Any]
 
 
 class Lexer:
+    """
+    The SQL lexer.
+
+    The whole program is split into tokens when the lexer is created. The tokens are
+    stored column-wise, in parallel arrays indexed by token position, so that reading a
+    token does not allocate an object for it. The last token is always an ``EOF`` token.
+
+    ``pos`` is the position of the current token, which the parser moves forward with
+    ``advance``.
+    """
+
     program: str
+    # The position of the current token.
+    pos: int
+    # The position of the EOF token.
+    eof_pos: int
+
+    # The token arrays.
+    types: array
+    values: List[Any]
+    original_values: List[Optional[str]]
+    precedences: array
+    # The index in ``program`` at which each token starts.
+    starts: array
+
+    # The state of the scanner, used only while the program is being tokenized.
     index: int
-    line: int
-    column: int
-
-    pushed_token: Optional[Token]
-    current_token: Token
 
     def __init__(self, program: str) -> None:
         self.program = program
         self.index = 0
-        self.line = 1
-        self.column = 1
 
-        self.pushed_token = None
-        self.advance()
+        self.types = array("b")
+        self.values = []
+        self.original_values = []
+        self.precedences = array("b")
+        self.starts = array("l")
+        self.tokenize()
 
-    def current(self) -> Token:
-        return (
-            self.pushed_token if self.pushed_token is not None else self.current_token
-        )
+        self.pos = 0
+        self.eof_pos = len(self.types) - 1
+
+    def current(self) -> TokenPair:
+        pos = self.pos
+        return self.types[pos], self.values[pos]
 
-    def check(self, types_and_values: CheckTokenType) -> Token:
+    def check(self, types_and_values: CheckTokenType) -> TokenPair:
         """
         Checks that the current token matches at least one of the items in
-        ``types_and_values``. If the current token does match, it is returned. If not, a
-        SQLiteParserError is raised.
+        ``types_and_values``. If the current token does match, its ``(type, value)`` pair
+        is returned. If not, a SQLiteParserError is raised.
 
-        Each item in ``types_and_values`` must be one of the following types:
+        ``types_and_values`` is a set, usually a frozenset constant defined once by the
+        caller, so that each kind of item can be checked with a single lookup. Each item
+        must be one of the following types:
 
           - A string, which matches a ``KEYWORD`` token with that string's value
           - A ``TokenType`` instance, which matches a token with that type
           - A ``(TokenType, string)`` pair, which matches a token with that type and
               that value.
         """
-        token = self.current()
-        if token is None:
-            raise SQLiteParserError("premature end of input")
-
-        if token.type == TokenType.UNKNOWN:
-            raise SQLiteParserError(f"unknown token: {token.value!r}")
-
-        for type_or_value in types_and_values:
-            if isinstance(type_or_value, str):
-                if token.type == TokenType.KEYWORD and token.value == type_or_value:
-                    return token
-            elif isinstance(type_or_value, tuple):
-                if token.type == type_or_value[0] and token.value == type_or_value[1]:
-                    return token
-            else:
-                if token.type == type_or_value:
-                    return token
+        pos = self.pos
+        token_type = self.types[pos]
+        value = self.values[pos]
 
-        expected = " or ".join(
-            type_or_value if isinstance(type_or_value, str) else repr(type_or_value)
-            for type_or_value in types_and_values
-        )
-        raise SQLiteParserError(f"expected {expected}, got {token.value!r}")
+        if token_type == TokenType.UNKNOWN:
+            raise SQLiteParserError(f"unknown token: {value!r}")
 
-    def advance(self, expecting: Optional[CheckTokenType] = None) -> Token:
-        if self.pushed_token is not None:
-            ret = self.pushed_token
-            self.pushed_token = None
-            self.current_token = ret
-            return ret
+        if token_type in types_and_values:
+            return token_type, value
 
-        self.read_whitespace()
+        if token_type == TokenType.KEYWORD:
+            if value in types_and_values:
+                return token_type, value
+        elif (token_type, value) in types_and_values:
+            return token_type, value
 
-        if self.done():
+        expected = " or ".join(
+            sorted(
+                type_or_value if isinstance(type_or_value, str) else repr(type_or_value)
+                for type_or_value in types_and_values
+            )
+        )
+        raise SQLiteParserError(f"expected {expected}, got {value!r}")
+
+    def advance(self, expecting: Optional[CheckTokenType] = None) -> TokenPair:
+        if self.pos >= self.eof_pos - 1:
             if expecting is not None:
                 raise SQLiteParserError("premature end of input")
 
-            self.current_token = Token(TokenType.EOF, "", self.line, self.column)
-            return self.current_token
+            self.pos = self.eof_pos
+        else:
+            self.pos += 1
+            if expecting is not None:
+                return self.check(expecting)
+
+        pos = self.pos
+        return self.types[pos], self.values[pos]
+
+    def following_index(self) -> int:
+        """
+        Returns the index in the program at which the token after the current one
+        starts, or the length of the program if there is no such token.
+        """
+        return self.starts[min(self.pos + 1, self.eof_pos)]
+
+    def tokenize(self) -> None:
+        # This loop runs once per token, so the methods and enum members that it uses
+        # are bound to locals.
+        program = self.program
+        length = len(program)
+        append_type = self.types.append
+        append_value = self.values.append
+        append_original_value = self.original_values.append
+        append_precedence = self.precedences.append
+        append_start = self.starts.append
+        get_precedence = PRECEDENCE.get
+        read_token = self.read_token
+        read_whitespace = self.read_whitespace
+        KEYWORD = TokenType.KEYWORD
+        IDENTIFIER = TokenType.IDENTIFIER
+        STRING = TokenType.STRING
+
+        read_whitespace()
+        while self.index < length:
+            start = self.index
+            token_type, value = read_token()
+
+            append_type(token_type)
+            append_value(value)
+            if token_type == KEYWORD:
+                append_original_value(program[start : self.index])
+            else:
+                append_original_value(None)
+
+            # Quoted identifiers and strings are never operators, even if their value
+            # happens to be, e.g., "AND".
+            if token_type == IDENTIFIER or token_type == STRING:
+                append_precedence(-1)
+            else:
+                append_precedence(get_precedence(value, -1))
 
-        self.current_token = self._advance()
-        if expecting is not None:
-            self.check(expecting)
+            append_start(start)
+            read_whitespace()
 
-        self.read_whitespace()
-        return self.current_token
+        append_type(TokenType.EOF)
+        append_value("")
+        append_original_value(None)
+        append_precedence(-1)
+        append_start(length)
 
-    def _advance(self) -> Token:
+    def read_token(self) -> Tuple[TokenType, Any]:
         c = self.c()
         if c.upper() == "X" and self.peek() == "'":
             return self.read_blob()
@@ -167,64 +229,59 @@ class Lexer:
         else:
             return self.character_token(TokenType.UNKNOWN)
 
-    def push(self, token: Token) -> None:
-        if self.pushed_token is not None:
-            raise SQLiteParserError("token already pushed")
-
-        self.pushed_token = token
-
-    def done(self) -> bool:
+    def at_end(self) -> bool:
         return self.index == len(self.program)
 
     def read_whitespace(self) -> None:
-        while not self.done() and self.c().isspace():
-            self.next_character()
-
-    def read_symbol(self) -> Token:
-        start = self.index
-        start_column = self.column
-        while not self.done() and is_symbol_character(self.c()):
-            self.next_character()
-
-        value = self.program[start : self.index]
-        if value.upper() in SQL_KEYWORDS:
-            return Token(
-                type=TokenType.KEYWORD,
-                value=value.upper(),
-                original_value=value,
-                line=self.line,
-                column=start_column,
-            )
+        # The loops that scan one character at a time work on local copies of the
+        # program and the index, rather than calling at_end, c and next_character for
+        # each character.
+        program = self.program
+        length = len(program)
+        index = self.index
+        while index < length and program[index].isspace():
+            index += 1
+        self.index = index
+
+    def read_symbol(self) -> Tuple[TokenType, Any]:
+        program = self.program
+        length = len(program)
+        start = index = self.index
+        while index < length:
+            c = program[index]
+            if not (c.isalpha() or c.isdigit() or c == "_"):
+                break
+            index += 1
+        self.index = index
+
+        value = program[start:index]
+        upper_value = value.upper()
+        if upper_value in SQL_KEYWORDS:
+            # Keywords are interned so that the parser can compare them by identity.
+            return TokenType.KEYWORD, sys.intern(upper_value)
         else:
-            return Token(
-                type=TokenType.IDENTIFIER,
-                value=value,
-                line=self.line,
-                column=start_column,
-            )
+            return TokenType.IDENTIFIER, value
 
-    def read_integer(self) -> Token:
-        start = self.index
-        start_column = self.column
-        while not self.done() and self.c().isdigit():
-            self.next_character()
+    def read_integer(self) -> Tuple[TokenType, Any]:
+        program = self.program
+        length = len(program)
+        start = index = self.index
+        while index < length and program[index].isdigit():
+            index += 1
+        self.index = index
 
-        value = self.program[start : self.index]
-        return Token(
-            type=TokenType.INTEGER, value=value, line=self.line, column=start_column
-        )
+        return TokenType.INTEGER, program[start:index]
 
-    def read_blob(self) -> Token:
-        start_column = self.column
+    def read_blob(self) -> Tuple[TokenType, Any]:
         characters = []
 
         self.next_character()
         self.next_character()
-        while not self.done() and self.c() != "'":
+        while not self.at_end() and self.c() != "'":
             d1 = self.c()
 
             self.next_character()
-            if self.done():
+            if self.at_end():
                 raise SQLiteParserError("unterminated blob literal")
 
             d2 = self.c()
@@ -238,57 +295,43 @@ class Lexer:
             characters.append(int(d1 + d2, base=16))
             self.next_character()
 
-        if self.done():
+        if self.at_end():
             raise SQLiteParserError("unterminated blob literal")
         else:
             self.next_character()
 
-        return Token(
-            type=TokenType.BLOB,
-            value=bytes(characters),
-            line=self.line,
-            column=start_column,
-        )
+        return TokenType.BLOB, bytes(characters)
 
     def read_generic_string(
         self, token_type: TokenType, delimiter: str, *, allow_doubling: bool = True
-    ) -> Token:
-        start_column = self.column
-        characters = []
-
-        self.next_character()
-        while not self.done():
-            if self.c() == delimiter:
+    ) -> Tuple[TokenType, Any]:
+        characters: List[str] = []
+        append = characters.append
+
+        program = self.program
+        length = len(program)
+        index = self.index + 1
+        while index < length:
+            c = program[index]
+            if c == delimiter:
                 # SQL escapes quotes by doubling them.
-                if allow_doubling and self.prefix(2) == delimiter * 2:
-                    characters.append(delimiter)
-                    self.next_character()
-                    self.next_character()
+                if allow_doubling and program[index + 1 : index + 2] == delimiter:
+                    append(delimiter)
+                    index += 2
                 else:
                     break
             else:
-                characters.append(self.c())
-                self.next_character()
+                append(c)
+                index += 1
 
-        if self.done():
+        if index == length:
+            self.index = index
             raise SQLiteParserError(f"expected delimiter: {delimiter}")
-        else:
-            self.next_character()
 
-        return Token(
-            type=token_type,
-            value="".join(characters),
-            line=self.line,
-            column=start_column,
-        )
+        self.index = index + 1
+        return token_type, "".join(characters)
 
     def next_character(self) -> None:
-        if self.c() == "\n":
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-
         self.index += 1
 
     def c(self) -> str:
@@ -303,20 +346,50 @@ class Lexer:
     def prefix(self, length: int) -> str:
         return self.program[self.index : self.index + length]
 
-    def character_token(self, type: TokenType) -> Token:
+    def character_token(self, type: TokenType) -> Tuple[TokenType, Any]:
         return self.multi_character_token(type, 1)
 
-    def multi_character_token(self, type: TokenType, length: int) -> Token:
-        value = self.program[self.index : self.index + length]
-        line = self.line
-        column = self.column
+    def multi_character_token(
+        self, type: TokenType, length: int
+    ) -> Tuple[TokenType, Any]:
+        value = sys.intern(self.program[self.index : self.index + length])
         for _ in range(length):
             self.next_character()
-        return Token(type=type, value=value, line=line, column=column)
-
-
-def is_symbol_character(c: str) -> bool:
-    return c.isalpha() or c.isdigit() or c == "_"
+        return type, value
+
+
+# The binding precedence of the operators that can follow the left operand of an
+# expression, from https://sqlite.org/lang_expr.html. The lexer stores it with each
+# token, so that the parser does not have to look it up by value.
+PRECEDENCE = {
+    "OR": 0,
+    "AND": 1,
+    "=": 2,
+    "==": 2,
+    "!=": 2,
+    "<>": 2,
+    "IS": 2,
+    "IN": 2,
+    "LIKE": 2,
+    "GLOB": 2,
+    "MATCH": 2,
+    "REGEXP": 2,
+    "<": 3,
+    "<=": 3,
+    ">": 3,
+    ">=": 3,
+    "<<": 4,
+    ">>": 4,
+    "&": 4,
+    "|": 4,
+    "+": 5,
+    "-": 5,
+    "*": 6,
+    "/": 6,
+    "%": 6,
+    "||": 7,
+    "(": 8,
+}
 
 
 # According to https://sqlite.org/lang_keywords.html
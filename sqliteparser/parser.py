@@ -1,10 +1,128 @@
+import sys
 from ast import Not
 from functools import partialmethod
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Union, cast
 
 from . import ast
 from .exceptions import SQLiteParserError, SQLiteParserImpossibleError
-from .lexer import Lexer, TokenType
+from .lexer import PRECEDENCE, CheckTokenType, Lexer, TokenType
+
+
+# Keyword and operator values are interned by the lexer, so the parser compares them by
+# identity.
+_AS = sys.intern("AS")
+_ASC = sys.intern("ASC")
+_AUTOINCREMENT = sys.intern("AUTOINCREMENT")
+_CASCADE = sys.intern("CASCADE")
+_CHECK = sys.intern("CHECK")
+_COLLATE = sys.intern("COLLATE")
+_CREATE = sys.intern("CREATE")
+_CURRENT_DATE = sys.intern("CURRENT_DATE")
+_CURRENT_TIME = sys.intern("CURRENT_TIME")
+_CURRENT_TIMESTAMP = sys.intern("CURRENT_TIMESTAMP")
+_DEFAULT = sys.intern("DEFAULT")
+_DEFERRABLE = sys.intern("DEFERRABLE")
+_DEFERRED = sys.intern("DEFERRED")
+_DELETE = sys.intern("DELETE")
+_DESC = sys.intern("DESC")
+_DISTINCT = sys.intern("DISTINCT")
+_FOREIGN = sys.intern("FOREIGN")
+_FULL = sys.intern("FULL")
+_GENERATED = sys.intern("GENERATED")
+_IF = sys.intern("IF")
+_INDEX = sys.intern("INDEX")
+_INITIALLY = sys.intern("INITIALLY")
+_MATCH = sys.intern("MATCH")
+_NO = sys.intern("NO")
+_NOT = sys.intern("NOT")
+_NULL = sys.intern("NULL")
+_ON = sys.intern("ON")
+_PRIMARY = sys.intern("PRIMARY")
+_REFERENCES = sys.intern("REFERENCES")
+_RESTRICT = sys.intern("RESTRICT")
+_SELECT = sys.intern("SELECT")
+_SET = sys.intern("SET")
+_TABLE = sys.intern("TABLE")
+_TEMP = sys.intern("TEMP")
+_TEMPORARY = sys.intern("TEMPORARY")
+_TRIGGER = sys.intern("TRIGGER")
+_UNIQUE = sys.intern("UNIQUE")
+_VIEW = sys.intern("VIEW")
+_VIRTUAL = sys.intern("VIRTUAL")
+_WHERE = sys.intern("WHERE")
+_WITHOUT = sys.intern("WITHOUT")
+_STAR = sys.intern("*")
+
+# The token types and values that the parser expects at each point; see Lexer.check.
+_EXPECT_SEMICOLON_OR_EOF = frozenset([TokenType.SEMICOLON, TokenType.EOF])
+_EXPECT_CREATE_TYPE = frozenset(
+    ["TABLE", "TEMPORARY", "TEMP", "UNIQUE", "INDEX", "TRIGGER", "VIEW", "VIRTUAL"]
+)
+_EXPECT_TEMPORARY_TYPE = frozenset(["TABLE", "TRIGGER", "VIEW"])
+_EXPECT_INDEX = frozenset(["INDEX"])
+_EXPECT_TABLE = frozenset(["TABLE"])
+_EXPECT_IF_OR_IDENTIFIER_OR_TEMP: CheckTokenType = frozenset(["IF", TokenType.IDENTIFIER, "TEMP"])
+_EXPECT_NOT = frozenset(["NOT"])
+_EXPECT_EXISTS = frozenset(["EXISTS"])
+_EXPECT_IDENTIFIER = frozenset([TokenType.IDENTIFIER])
+_EXPECT_DOT_OR_LEFT_PARENTHESIS_OR_KEYWORD = frozenset(
+    [TokenType.DOT, TokenType.LEFT_PARENTHESIS, TokenType.KEYWORD]
+)
+_EXPECT_LEFT_PARENTHESIS_OR_KEYWORD = frozenset(
+    [TokenType.LEFT_PARENTHESIS, TokenType.KEYWORD]
+)
+_EXPECT_COMMA_OR_RIGHT_PARENTHESIS = frozenset(
+    [TokenType.COMMA, TokenType.RIGHT_PARENTHESIS]
+)
+_EXPECT_ROWID = frozenset([(TokenType.IDENTIFIER, "ROWID")])
+_EXPECT_TABLE_OPTION: CheckTokenType = frozenset(
+    ["WITHOUT", (TokenType.IDENTIFIER, "STRICT")]
+)
+_EXPECT_ON = frozenset(["ON"])
+_EXPECT_LEFT_PARENTHESIS = frozenset([TokenType.LEFT_PARENTHESIS])
+_EXPECT_RIGHT_PARENTHESIS = frozenset([TokenType.RIGHT_PARENTHESIS])
+_EXPECT_IDENTIFIER_OR_KEYWORD = frozenset([TokenType.IDENTIFIER, TokenType.KEYWORD])
+_EXPECT_NULL = frozenset(["NULL"])
+_EXPECT_KEY = frozenset(["KEY"])
+_EXPECT_COLLATING_SEQUENCE = frozenset(
+    [
+        (TokenType.IDENTIFIER, "BINARY"),
+        (TokenType.IDENTIFIER, "NOCASE"),
+        (TokenType.IDENTIFIER, "RTRIM"),
+    ]
+)
+_EXPECT_FOREIGN = frozenset(["FOREIGN"])
+_EXPECT_REFERENCES = frozenset(["REFERENCES"])
+_EXPECT_DELETE_OR_UPDATE = frozenset(["DELETE", "UPDATE"])
+_EXPECT_FOREIGN_KEY_ACTION = frozenset(["SET", "CASCADE", "RESTRICT", "NO"])
+_EXPECT_NULL_OR_DEFAULT = frozenset(["NULL", "DEFAULT"])
+_EXPECT_ACTION = frozenset(["ACTION"])
+_EXPECT_SIMPLE_OR_FULL_OR_PARTIAL = frozenset(["SIMPLE", "FULL", "PARTIAL"])
+_EXPECT_DEFERRABLE = frozenset(["DEFERRABLE"])
+_EXPECT_DEFERRED_OR_IMMEDIATE = frozenset(["DEFERRED", "IMMEDIATE"])
+_EXPECT_PRIMARY = frozenset(["PRIMARY"])
+_EXPECT_UNIQUE = frozenset(["UNIQUE"])
+_EXPECT_CHECK = frozenset(["CHECK"])
+_EXPECT_GENERATED_OR_AS = frozenset(["GENERATED", "AS"])
+_EXPECT_ALWAYS = frozenset(["ALWAYS"])
+_EXPECT_AS = frozenset(["AS"])
+_EXPECT_DEFAULT = frozenset(["DEFAULT"])
+_EXPECT_DEFAULT_VALUE: CheckTokenType = frozenset(
+    [
+        TokenType.LEFT_PARENTHESIS,
+        TokenType.STRING,
+        TokenType.INTEGER,
+        TokenType.IDENTIFIER,
+        "NULL",
+        "CURRENT_TIME",
+        "CURRENT_DATE",
+        "CURRENT_TIMESTAMP",
+    ]
+)
+_EXPECT_CONFLICT = frozenset(["CONFLICT"])
+_EXPECT_CONFLICT_STRATEGY = frozenset(
+    ["ROLLBACK", "ABORT", "FAIL", "IGNORE", "REPLACE"]
+)
 
 
 def parse(program: str, *, debug: bool = False, verbatim: bool = False) -> List[ast.Node]:
@@ -12,7 +130,8 @@ def parse(program: str, *, debug: bool = False, verbatim: bool = False) -> List[
     Parse the SQL program into a list of AST objects.
     """
     lexer = Lexer(program)
-    parser = Parser(lexer, debug=debug, verbatim = verbatim)
+    parser_class = DebugParser if debug else Parser
+    parser = parser_class(lexer, verbatim=verbatim)
     return parser.parse()
 
 
@@ -21,27 +140,43 @@ def parse_column(column_string: str, *, debug: bool = False) -> ast.Column:
     Parse a single column from a ``CREATE TABLE`` statement.
     """
     lexer = Lexer(column_string)
-    parser = Parser(lexer, debug=debug)
+    parser_class = DebugParser if debug else Parser
+    parser = parser_class(lexer)
     return parser.parse_column()
 
 
-def debuggable(f):
-    def wrapped(self: "Parser", *args, **kwargs):
+# Names of the Parser methods that DebugParser traces.
+DEBUGGABLE_METHODS: Set[str] = set()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def debuggable(f: F) -> F:
+    """
+    Marks a Parser method to be traced by DebugParser.
+
+    The method itself is returned unchanged, so that the non-debugging parser does not
+    pay for an extra wrapper call on every match_XYZ method.
+    """
+    DEBUGGABLE_METHODS.add(f.__name__)
+    return f
+
+
+def traced(f: Callable[..., Any]) -> Callable[..., Any]:
+    def wrapped(self: "Parser", *args: Any, **kwargs: Any) -> Any:
         name = f.__name__
-        if self.debug:
-            indent = "  " * (self.debug_indent * 2)
-            self.debug_indent += 1
-            print(indent + f"{name} (token = {self.lexer.current().value!r})")
+        indent = "  " * (self.debug_indent * 2)
+        self.debug_indent += 1
+        print(indent + f"{name} (token = {self.lexer.current()[1]!r})")
 
         r = f(self, *args, **kwargs)
 
-        if self.debug:
-            print(
-                indent
-                + f"{name} returned (token = {self.lexer.current().value!r}, "
-                + f"value = {r!r})"
-            )
-            self.debug_indent -= 1
+        print(
+            indent
+            + f"{name} returned (token = {self.lexer.current()[1]!r}, "
+            + f"value = {r!r})"
+        )
+        self.debug_indent -= 1
 
         return r
 
@@ -60,50 +195,78 @@ class Parser:
         return the CREATE token.
 
       - It leaves the lexer positioned at one past the last token of the fragment.
+
+    The lexer hands out tokens as ``(type, value)`` pairs.
+
+    The match_XYZ methods that read many tokens bind ``self.lexer``, its methods, and
+    frequently compared TokenType members to local variables, since attribute lookups
+    (particularly on the enum) are much slower than local reads.
+
+    To print a trace of the match_XYZ calls, use DebugParser instead.
     """
 
     lexer: Lexer
-    debug: bool
+    # How deeply DebugParser has nested its trace.
     debug_indent: int
+    verbatim: bool
+    # Maps the keyword that begins a statement to the method that matches it.
+    _statement_dispatch: Dict[str, Callable[[], ast.Node]]
 
-    def __init__(self, lexer: Lexer, *, debug: bool = False, verbatim: bool = False) -> None:
+    def __init__(self, lexer: Lexer, *, verbatim: bool = False) -> None:
         self.lexer = lexer
-        self.debug = debug
         self.debug_indent = 0
         self.verbatim = verbatim
+        self._statement_dispatch = {
+            _CREATE: self.match_create_statement,
+            _SELECT: self.match_select_statement,
+        }
 
     def parse(self) -> List[ast.Node]:
-        statements = []
+        lexer = self.lexer
+        # Statements are separated by semicolons, so counting them (which the array does
+        # in C) bounds the number of statements. The unused slots are trimmed at the end.
+        statements: List[Optional[ast.Node]] = [None] * (
+            lexer.types.count(TokenType.SEMICOLON) + 1
+        )
+        n = 0
+        token_type, _ = lexer.current()
         while True:
-            if self.lexer.done():
+            # SQLite accepts empty statements, e.g. the stray `;;` often found in dumps.
+            while token_type == TokenType.SEMICOLON:
+                token_type, _ = lexer.advance()
+            if token_type == TokenType.EOF:
                 break
 
-            statement = self.match_statement()
-            statements.append(statement)
+            statements[n] = self.match_statement()
+            n += 1
 
-            if not self.lexer.done():
-                self.lexer.advance(expecting=[TokenType.SEMICOLON])
+            token_type, _ = lexer.check(_EXPECT_SEMICOLON_OR_EOF)
+            if token_type == TokenType.SEMICOLON:
+                token_type, _ = lexer.advance()
 
-        return statements
+        del statements[n:]
+        return cast(List[ast.Node], statements)
 
     def parse_column(self) -> ast.Column:
         column = self.match_column()
-        if not self.lexer.done():
+        token_type, _ = self.lexer.current()
+        if token_type != TokenType.EOF:
             raise SQLiteParserError("trailing input")
         return column
 
     @debuggable
     def match_statement(self) -> ast.Node:
-        token = self.lexer.current()
-        if token.type == TokenType.KEYWORD:
-            if token.value == "CREATE":  
-                return self.match_create_statement()
-            elif token.value == "SELECT":
-                return self.match_select_statement()
-            else:
-                raise SQLiteParserError(f"unexpected keyword: {token.value}")
-        else:
-            raise SQLiteParserError(f"unexpected token type: {token.type}")
+        token_type, value = self.lexer.current()
+        if token_type != TokenType.KEYWORD:
+            raise SQLiteParserError(
+                f"unexpected token type: {TokenType(token_type).name}"
+            )
+
+        match_method = self._statement_dispatch.get(value)
+        if match_method is None:
+            raise SQLiteParserError(f"unexpected keyword: {value}")
+
+        return match_method()
 
 
 
@@ -122,60 +285,67 @@ class Parser:
                                             ast.CreateTriggerStatement,
                                             ast.CreateViewStatement,
                                             ast.CreateVirtualTableStatement]:
-        token = self.lexer.advance(expecting=["TABLE", "TEMPORARY", "TEMP","UNIQUE","INDEX","TRIGGER","VIEW","VIRTUAL"])
+        lexer = self.lexer
+        advance = lexer.advance
+        _, value = advance(expecting=_EXPECT_CREATE_TYPE)
         temporary = False
         unique = False
         virtual = False
-        if token.value in ("TEMPORARY", "TEMP"):
+        if value is _TEMPORARY or value is _TEMP:
             temporary = True
-            self.lexer.advance(expecting=["TABLE","TRIGGER","VIEW"])
-        elif token.value == "UNIQUE":
+            advance(expecting=_EXPECT_TEMPORARY_TYPE)
+        elif value is _UNIQUE:
             unique = True
-            self.lexer.advance(expecting=["INDEX"])
-        elif token.value == "VIRTUAL":
+            advance(expecting=_EXPECT_INDEX)
+        elif value is _VIRTUAL:
             virtual = True
-            self.lexer.advance(expecting=["TABLE"])     
-        type = self.lexer.current_token.value 
-        token = self.lexer.advance(expecting=["IF", TokenType.IDENTIFIER, "TEMP"])
-        if token.value == "IF":
-            self.lexer.advance(expecting=["NOT"])
-            self.lexer.advance(expecting=["EXISTS"])
+            advance(expecting=_EXPECT_TABLE)     
+        _, type = lexer.current()
+        _, value = advance(expecting=_EXPECT_IF_OR_IDENTIFIER_OR_TEMP)
+        if value is _IF:
+            advance(expecting=_EXPECT_NOT)
+            advance(expecting=_EXPECT_EXISTS)
             if_not_exists = True
-            name_token = self.lexer.advance(expecting=[TokenType.IDENTIFIER])
+            _, name_value = advance(expecting=_EXPECT_IDENTIFIER)
         else:
             if_not_exists = False
-            name_token = token
-
-        token = self.lexer.advance(
-            expecting=[TokenType.DOT, TokenType.LEFT_PARENTHESIS,TokenType.KEYWORD])
-        if token.type == TokenType.DOT:
-            table_name_token = self.lexer.advance(expecting=[TokenType.IDENTIFIER])
-            name = ast.TableName(name_token.value, table_name_token.value)
-            self.lexer.advance(expecting=[TokenType.LEFT_PARENTHESIS,TokenType.KEYWORD])
+            name_value = value
+
+        token_type, _ = advance(
+            expecting=_EXPECT_DOT_OR_LEFT_PARENTHESIS_OR_KEYWORD)
+        if token_type == TokenType.DOT:
+            _, table_name = advance(expecting=_EXPECT_IDENTIFIER)
+            name = ast.TableName(name_value, table_name)
+            advance(expecting=_EXPECT_LEFT_PARENTHESIS_OR_KEYWORD)
         else:
-            name = name_token.value
+            name = name_value
 
-        if type == "TABLE":
+        if type is _TABLE:
             if virtual:
                 return self.match_create_virtual_table_statement(if_not_exists=if_not_exists,name=name)
             else:    
                 return self.match_create_table_statement(if_not_exists=if_not_exists,temporary=temporary,name=name)
-        elif type == "INDEX":
+        elif type is _INDEX:
             return self.match_create_index_statement(if_not_exists=if_not_exists,unique=unique,name=name)
-        elif type == "TRIGGER":
+        elif type is _TRIGGER:
             return self.match_create_trigger_statement(if_not_exists=if_not_exists, name=name)
-        elif type == "VIEW":
+        elif type is _VIEW:
             return self.match_create_view_statement(if_not_exists=if_not_exists, name=name)
         else:
             raise SQLiteParserError(f"unknown type :{type}")    
 
     @debuggable
-    def match_create_table_statement(self, if_not_exists, temporary, name) -> ast.CreateTableStatement:
+    def match_create_table_statement(
+        self, if_not_exists: bool, temporary: bool, name: Union[str, ast.TableName]
+    ) -> ast.CreateTableStatement:
+        lexer = self.lexer
+        advance = lexer.advance
+        RIGHT_PARENTHESIS = TokenType.RIGHT_PARENTHESIS
         columns = []
         constraints: List[ast.BaseConstraint] = []
         while True:
-            token = self.lexer.advance()
-            if token.type == TokenType.RIGHT_PARENTHESIS:
+            token_type, _ = advance()
+            if token_type == RIGHT_PARENTHESIS:
                 break
 
             column_or_constraint = self.match_column_or_constraint()
@@ -187,74 +357,81 @@ class Parser:
             else:
                 constraints.append(column_or_constraint)
 
-            token = self.lexer.check([TokenType.COMMA, TokenType.RIGHT_PARENTHESIS])
-            if token.type == TokenType.RIGHT_PARENTHESIS:
+            token_type, _ = lexer.check(_EXPECT_COMMA_OR_RIGHT_PARENTHESIS)
+            if token_type == RIGHT_PARENTHESIS:
                 break
 
               
-        without_rowid =  False
-        strict=False        
-        while True: 
-            token = self.lexer.advance()  
-            if token is not None:
-                if token.type == TokenType.KEYWORD and token.value == "WITHOUT":
-                    self.lexer.advance(expecting=[(TokenType.IDENTIFIER, "ROWID")])
-                    without_rowid = True
-                elif token.type == TokenType.IDENTIFIER and token.value == "STRICT":
-                    strict = True
-                self.lexer.advance()  
-                token = self.lexer.check([TokenType.COMMA,TokenType.SEMICOLON,TokenType.EOF])
-                if token.type !=TokenType.COMMA:
-                    break
+        # Table options, e.g. WITHOUT ROWID and STRICT, follow the closing parenthesis
+        # and are separated by commas.
+        without_rowid = False
+        strict = False
+        token_type, value = advance()
+        while True:
+            if token_type == TokenType.KEYWORD and value is _WITHOUT:
+                advance(expecting=_EXPECT_ROWID)
+                without_rowid = True
+            elif token_type == TokenType.IDENTIFIER and value == "STRICT":
+                strict = True
             else:
                 break
 
+            token_type, _ = advance()
+            if token_type != TokenType.COMMA:
+                break
+            token_type, value = advance(expecting=_EXPECT_TABLE_OPTION)
+
         return ast.CreateTableStatement(
-            name=name,
-            columns=columns,
-            constraints=constraints,
-            as_select=None,
-            temporary=temporary,
-            without_rowid=without_rowid,
-            strict=strict,
-            if_not_exists=if_not_exists)    
+            name,
+            columns,
+            constraints,
+            None,
+            temporary,
+            without_rowid,
+            strict,
+            if_not_exists,
+        )
 
     @debuggable
-    def match_create_index_statement(self, if_not_exists, unique, name) -> ast.CreateIndexStatement:
-        self.lexer.check(["ON"])
-        token = self.lexer.advance()
-        table=token.value
-        self.lexer.advance(expecting=[TokenType.LEFT_PARENTHESIS])
-        self.lexer.advance()
+    def match_create_index_statement(
+        self, if_not_exists: bool, unique: bool, name: Union[str, ast.TableName]
+    ) -> ast.CreateIndexStatement:
+        lexer = self.lexer
+        advance = lexer.advance
+        check = lexer.check
+        check(_EXPECT_ON)
+        _, table = advance()
+        advance(expecting=_EXPECT_LEFT_PARENTHESIS)
+        advance()
         columns = self.match_identifier_list()
-        self.lexer.check([TokenType.RIGHT_PARENTHESIS])  
-        token = self.lexer.advance(expecting=[TokenType.SEMICOLON,TokenType.KEYWORD])
-        if token.type == TokenType.SEMICOLON:
-            where= None
-        else:    
-            self.lexer.check(['WHERE'])
-            start_index = self.lexer.index
-            self.lexer.advance()
+        check(_EXPECT_RIGHT_PARENTHESIS)  
+        token_type, value = advance()
+        where: Optional[ast.Expression]
+        if token_type == TokenType.KEYWORD and value is _WHERE:
+            start_index = lexer.following_index()
+            advance()
             where = self.match_expression(verbatim=self.verbatim, start_index=start_index)
+        else:
+            where = None
    
-        return ast.CreateIndexStatement(
-            name=name,
-            if_not_exists=if_not_exists,
-            table=table,
-            columns=columns,
-            unique=unique,
-            where=where)       
+        return ast.CreateIndexStatement(name, table, columns, if_not_exists, unique, where)
 
     @debuggable
-    def match_create_virtual_table_statement(self, if_not_exists, name) -> ast.CreateVirtualTableStatement:
+    def match_create_virtual_table_statement(
+        self, if_not_exists: bool, name: Union[str, ast.TableName]
+    ) -> ast.CreateVirtualTableStatement:
         raise NotImplementedError('Create virtual table is not yet implemented')
 
     @debuggable
-    def match_create_trigger_statement(self, if_not_exists, name) -> ast.CreateTriggerStatement:
+    def match_create_trigger_statement(
+        self, if_not_exists: bool, name: Union[str, ast.TableName]
+    ) -> ast.CreateTriggerStatement:
         raise NotImplementedError('Create trigger is not yet implemented')
 
     @debuggable
-    def match_create_view_statement(self, if_not_exists, name) -> ast.CreateViewStatement:
+    def match_create_view_statement(
+        self, if_not_exists: bool, name: Union[str, ast.TableName]
+    ) -> ast.CreateViewStatement:
         raise NotImplementedError('create view is not yet implemented')
 
 
@@ -265,142 +442,187 @@ class Parser:
     def match_select_statement(self) -> ast.SelectStatement:
         self.lexer.advance()
         e = self.match_expression()
-        return ast.SelectStatement(columns=[e])
+        return ast.SelectStatement([e])
 
     @debuggable
     def match_column_or_constraint(self) -> Union[ast.BaseConstraint, ast.Column]:
-        token = self.lexer.current()
-        if token.type == TokenType.KEYWORD and token.value == "FOREIGN":
+        KEYWORD = TokenType.KEYWORD
+        token_type, value = self.lexer.current()
+        if token_type == KEYWORD and value is _FOREIGN:
             return self.match_foreign_key_constraint()
-        elif token.type == TokenType.KEYWORD and token.value == "PRIMARY":
+        elif token_type == KEYWORD and value is _PRIMARY:
             return self.match_primary_key_table_constraint()
-        elif token.type == TokenType.KEYWORD and token.value == "UNIQUE":
+        elif token_type == KEYWORD and value is _UNIQUE:
             return self.match_unique_table_constraint()  
-        elif token.type == TokenType.KEYWORD and token.value == "CHECK":
+        elif token_type == KEYWORD and value is _CHECK:
             return self.match_check_constraint()        
-        elif token.type == TokenType.IDENTIFIER or token.type == TokenType.KEYWORD:
+        elif token_type == TokenType.IDENTIFIER or token_type == KEYWORD:
             return self.match_column()
         else:
             raise SQLiteParserError("expected start of column or constraint")
 
     @debuggable
     def match_column(self) -> ast.Column:
+        lexer = self.lexer
+        advance = lexer.advance
+        KEYWORD = TokenType.KEYWORD
         # SQLite allows some but not all SQL keywords to serve as column names. We are
         # more permissive here. See #5 for details.
-        name_token = self.lexer.check([TokenType.IDENTIFIER, TokenType.KEYWORD])
-        if name_token.type == TokenType.KEYWORD:
-            # Use ``original_value`` because it preserves the original case of the
+        token_type, name = lexer.check(_EXPECT_IDENTIFIER_OR_KEYWORD)
+        if token_type == KEYWORD:
+            # Use the original value because it preserves the original case of the
             # identifier instead of putting it in all caps.
-            name = name_token.original_value
-        else:
-            name = name_token.value
+            name = lexer.original_values[lexer.pos]
 
         assert name is not None
 
         column_type = self.match_column_type()
-        token = self.lexer.current()
-        constraints = []
+        token_type, value = lexer.current()
+        constraints: List[ast.BaseConstraint] = []
         default = None
-        while True:
-            if token is not None and token.type == TokenType.KEYWORD:
-                if token.value == "PRIMARY":
-                    constraints.append(self.match_primary_key_constraint())
-                elif token.value == "NOT":
-                    constraints.append(self.match_not_null_constraint())
-                elif token.value == "CHECK":
-                    constraints.append(self.match_check_constraint())
-                elif token.value == "COLLATE":
-                    constraints.append(self.match_collate_constraint())
-                elif token.value == "REFERENCES":
-                    constraints.append(self.match_foreign_key_clause(columns=[]))
-                elif token.value == "UNIQUE":
-                    constraints.append(self.match_unique_constraint())
-                elif token.value == "GENERATED" or token.value == "AS":
-                    constraints.append(self.match_generated_column_constraint())
-                elif token.value == "DEFAULT":
-                    default = self.match_default_clause()
-                elif token.value == "NULL":
-                    # Django's ORM will produce columns with a NULL constraint, and
-                    # SQLite accepts it although it is not documented and appears to
-                    # have no effect.
-                    self.lexer.advance()
+        # The simple column constraints are parsed inline rather than by their own
+        # match_XYZ methods, to save a method call per constraint.
+        on_conflict: Optional[ast.OnConflict]
+        while token_type == KEYWORD:
+            if value is _NOT:
+                advance(expecting=_EXPECT_NULL)
+                token_type, value = advance()
+                if token_type == KEYWORD and value is _ON:
+                    on_conflict = self.match_on_conflict_clause()
+                else:
+                    on_conflict = None
+                constraints.append(ast.NotNullConstraint(on_conflict))
+            elif value is _PRIMARY:
+                advance(expecting=_EXPECT_KEY)
+                token_type, value = advance()
+
+                ascending: Optional[bool] = None
+                if token_type == KEYWORD and (
+                    value is _ASC or value is _DESC
+                ):
+                    ascending = value is _ASC
+                    token_type, value = advance()
+
+                if token_type == KEYWORD and value is _ON:
+                    on_conflict = self.match_on_conflict_clause()
+                    token_type, value = lexer.current()
+                else:
+                    on_conflict = None
+
+                if token_type == KEYWORD and value is _AUTOINCREMENT:
+                    autoincrement = True
+                    advance()
+                else:
+                    autoincrement = False
+
+                constraints.append(
+                    ast.PrimaryKeyConstraint(ascending, on_conflict, autoincrement)
+                )
+            elif value is _UNIQUE:
+                token_type, value = advance()
+                if token_type == KEYWORD and value is _ON:
+                    on_conflict = self.match_on_conflict_clause()
                 else:
-                    raise SQLiteParserError(f"unexpected keyword: {token.value}")
+                    on_conflict = None
+                constraints.append(ast.UniqueConstraint(on_conflict))
+            elif value is _COLLATE:
+                _, sequence = advance(expecting=_EXPECT_COLLATING_SEQUENCE)
+                advance()
+                constraints.append(
+                    ast.CollateConstraint(ast.CollatingSequence[sequence])
+                )
+            elif value is _CHECK:
+                constraints.append(self.match_check_constraint())
+            elif value is _REFERENCES:
+                constraints.append(self.match_foreign_key_clause(columns=[]))
+            elif value is _GENERATED or value is _AS:
+                constraints.append(self.match_generated_column_constraint())
+            elif value is _DEFAULT:
+                default = self.match_default_clause()
+            elif value is _NULL:
+                # Django's ORM will produce columns with a NULL constraint, and
+                # SQLite accepts it although it is not documented and appears to
+                # have no effect.
+                advance()
             else:
-                break
+                raise SQLiteParserError(f"unexpected keyword: {value}")
 
-            token = self.lexer.current()
+            token_type, value = lexer.current()
 
         if column_type is None and default is None and not constraints:
             definition = None
         else:
-            definition = ast.ColumnDefinition(
-                type=column_type,
-                default=default,
-                constraints=constraints,
-            )
+            definition = ast.ColumnDefinition(column_type, default, constraints)
 
-        return ast.Column(name=name, definition=definition)
+        return ast.Column(name, definition)
 
     @debuggable
     def match_column_type(self) -> Optional[Union[str, ast.ColumnType]]:
-        type_token = self.lexer.advance()
-        if type_token.type != TokenType.IDENTIFIER:
+        lexer = self.lexer
+        advance = lexer.advance
+        token_type, type_name = advance()
+        if token_type != TokenType.IDENTIFIER:
             return None
 
-        token = self.lexer.advance()
-        if token.type == TokenType.LEFT_PARENTHESIS:
+        token_type, value = advance()
+        if token_type == TokenType.LEFT_PARENTHESIS:
             args = []
             while True:
-                token = self.lexer.advance()
-                if token.type == TokenType.RIGHT_PARENTHESIS:
+                token_type, value = advance()
+                if token_type == TokenType.RIGHT_PARENTHESIS:
                     break
-                elif token.type == TokenType.INTEGER:
-                    args.append(int(token.value))
-                    token = self.lexer.advance()
-                    if token.type == TokenType.COMMA:
+                elif token_type == TokenType.INTEGER:
+                    args.append(int(value))
+                    token_type, value = advance()
+                    if token_type == TokenType.COMMA:
                         continue
-                    elif token.type == TokenType.RIGHT_PARENTHESIS:
+                    elif token_type == TokenType.RIGHT_PARENTHESIS:
                         break
                     else:
                         raise SQLiteParserError("expected comma or right parenthesis")
 
-            token = self.lexer.advance()
-            return ast.ColumnType(name=type_token.value, args=args)
+            advance()
+            return ast.ColumnType(type_name, args)
         else:
             # SQL allows for multi-word column types, e.g. `smallint unsigned`.
-            name_parts = [type_token.value]
-            while token.type == TokenType.IDENTIFIER:
-                name_parts.append(token.value)
-                token = self.lexer.advance()
+            name_parts = [type_name]
+            while token_type == TokenType.IDENTIFIER:
+                name_parts.append(value)
+                token_type, value = advance()
             return " ".join(name_parts)
 
     @debuggable
     def match_foreign_key_constraint(self) -> ast.ForeignKeyConstraint:
-        self.lexer.check(["FOREIGN"])
-        self.lexer.advance(expecting=["KEY"])
-
-        self.lexer.advance(expecting=[TokenType.LEFT_PARENTHESIS])
-        self.lexer.advance()
+        lexer = self.lexer
+        advance = lexer.advance
+        check = lexer.check
+        check(_EXPECT_FOREIGN)
+        advance(expecting=_EXPECT_KEY)
+
+        advance(expecting=_EXPECT_LEFT_PARENTHESIS)
+        advance()
         columns = self.match_identifier_list()
-        self.lexer.check([TokenType.RIGHT_PARENTHESIS])
-        self.lexer.advance()
+        check(_EXPECT_RIGHT_PARENTHESIS)
+        advance()
         return self.match_foreign_key_clause(columns=columns)
 
     @debuggable
     def match_foreign_key_clause(
         self, *, columns: List[str]
     ) -> ast.ForeignKeyConstraint:
-        self.lexer.check(["REFERENCES"])
+        lexer = self.lexer
+        advance = lexer.advance
+        check = lexer.check
+        check(_EXPECT_REFERENCES)
 
-        foreign_table = self.lexer.advance(expecting=[TokenType.IDENTIFIER]).value
+        _, foreign_table = advance(expecting=_EXPECT_IDENTIFIER)
 
-        token = self.lexer.advance()
-        if token is not None and token.type == TokenType.LEFT_PARENTHESIS:
-            self.lexer.advance()
+        token_type, value = advance()
+        if token_type == TokenType.LEFT_PARENTHESIS:
+            advance()
             foreign_columns = self.match_identifier_list()
-            self.lexer.check([TokenType.RIGHT_PARENTHESIS])
-            token = self.lexer.advance()
+            check(_EXPECT_RIGHT_PARENTHESIS)
+            token_type, value = advance()
         else:
             foreign_columns = []
 
@@ -411,468 +633,404 @@ class Parser:
         initially_deferred = None
 
         while True:
-            if token is None:
-                break
-
-            if token.value == "ON":
-                delete_or_update = self.lexer.advance(expecting=["DELETE", "UPDATE"])
-                token = self.lexer.advance(
-                    expecting=["SET", "CASCADE", "RESTRICT", "NO"]
+            if value is _ON:
+                _, delete_or_update = advance(
+                    expecting=_EXPECT_DELETE_OR_UPDATE
                 )
-                if token.value == "SET":
-                    token = self.lexer.advance(expecting=["NULL", "DEFAULT"])
-                    value = (
+                _, value = advance(expecting=_EXPECT_FOREIGN_KEY_ACTION)
+                if value is _SET:
+                    _, value = advance(expecting=_EXPECT_NULL_OR_DEFAULT)
+                    action = (
                         ast.OnDelete.SET_NULL
-                        if token.value == "NULL"
+                        if value is _NULL
                         else ast.OnDelete.SET_DEFAULT
                     )
-                elif token.value == "NO":
-                    self.lexer.advance(expecting=["ACTION"])
-                    value = ast.OnDelete.NO_ACTION
-                elif token.value == "CASCADE":
-                    value = ast.OnDelete.CASCADE
-                elif token.value == "RESTRICT":
-                    value = ast.OnDelete.RESTRICT
+                elif value is _NO:
+                    advance(expecting=_EXPECT_ACTION)
+                    action = ast.OnDelete.NO_ACTION
+                elif value is _CASCADE:
+                    action = ast.OnDelete.CASCADE
+                elif value is _RESTRICT:
+                    action = ast.OnDelete.RESTRICT
                 else:
-                    raise SQLiteParserImpossibleError(token.value)
+                    raise SQLiteParserImpossibleError(value)
 
-                if delete_or_update.value == "DELETE":
-                    on_delete = value
+                if delete_or_update is _DELETE:
+                    on_delete = action
                 else:
-                    on_update = value
-            elif token.value == "MATCH":
-                match_token = self.lexer.advance(
-                    expecting=["SIMPLE", "FULL", "PARTIAL"]
+                    on_update = action
+            elif value is _MATCH:
+                _, match_value = advance(
+                    expecting=_EXPECT_SIMPLE_OR_FULL_OR_PARTIAL
                 )
-                if match_token.value == "FULL":
+                if match_value is _FULL:
                     match = ast.ForeignKeyMatch.FULL
-                elif match_token.value == "PARTIAL":
+                elif match_value == "PARTIAL":
                     match = ast.ForeignKeyMatch.PARTIAL
                 else:
                     match = ast.ForeignKeyMatch.SIMPLE
-            elif token.value == "NOT" or token.value == "DEFERRABLE":
-                if token.value == "NOT":
-                    self.lexer.advance(expecting=["DEFERRABLE"])
+            elif value is _NOT or value is _DEFERRABLE:
+                if value is _NOT:
+                    advance(expecting=_EXPECT_DEFERRABLE)
                     deferrable = False
                 else:
                     deferrable = True
 
-                token = self.lexer.advance()
-                if not (token.type == TokenType.KEYWORD and token.value == "INITIALLY"):
+                token_type, value = advance()
+                if not (token_type == TokenType.KEYWORD and value is _INITIALLY):
                     break
 
-                token = self.lexer.advance(expecting=["DEFERRED", "IMMEDIATE"])
-                initially_deferred = bool(token.value == "DEFERRED")
-                self.lexer.advance()
+                _, value = advance(expecting=_EXPECT_DEFERRED_OR_IMMEDIATE)
+                initially_deferred = value is _DEFERRED
+                advance()
                 break
             else:
                 break
 
-            token = self.lexer.advance()
+            token_type, value = advance()
 
         return ast.ForeignKeyConstraint(
-            columns=columns,
-            foreign_table=foreign_table,
-            foreign_columns=foreign_columns,
-            on_delete=on_delete,
-            on_update=on_update,
-            match=match,
-            deferrable=deferrable,
-            initially_deferred=initially_deferred,
-        )
-
-    @debuggable
-    def match_not_null_constraint(self) -> ast.NotNullConstraint:
-        self.lexer.check(["NOT"])
-        self.lexer.advance(expecting=["NULL"])
-        token = self.lexer.advance()
-        if (
-            token is not None
-            and token.type == TokenType.KEYWORD
-            and token.value == "ON"
-        ):
-            on_conflict = self.match_on_conflict_clause()
-        else:
-            on_conflict = None
-        return ast.NotNullConstraint(on_conflict=on_conflict)
-
-    @debuggable
-    def match_primary_key_constraint(self) -> ast.PrimaryKeyConstraint:
-        # NOTE: Not to be confused with match_primary_key_table_constraint, which is for
-        # table-level constraints.
-        self.lexer.check(["PRIMARY"])
-        self.lexer.advance(expecting=["KEY"])
-        token = self.lexer.advance()
-
-        if token is None or token.type != TokenType.KEYWORD:
-            return ast.PrimaryKeyConstraint()
-
-        ascending: Optional[bool]
-        if token.value == "ASC":
-            ascending = True
-            token = self.lexer.advance()
-        elif token.value == "DESC":
-            ascending = False
-            token = self.lexer.advance()
-        else:
-            ascending = None
-
-        if token.type != TokenType.KEYWORD:
-            return ast.PrimaryKeyConstraint(ascending=ascending)
-
-        if token.value == "ON":
-            on_conflict = self.match_on_conflict_clause()
-            token = self.lexer.current()
-        else:
-            on_conflict = None
-
-        if token.type != TokenType.KEYWORD:
-            return ast.PrimaryKeyConstraint(
-                ascending=ascending, on_conflict=on_conflict
-            )
-
-        if token.value == "AUTOINCREMENT":
-            autoincrement = True
-            self.lexer.advance()
-        else:
-            autoincrement = False
-
-        return ast.PrimaryKeyConstraint(
-            ascending=ascending, on_conflict=on_conflict, autoincrement=autoincrement
+            columns,
+            foreign_table,
+            foreign_columns,
+            on_delete,
+            on_update,
+            match,
+            deferrable,
+            initially_deferred,
         )
 
     @debuggable
     def match_primary_key_table_constraint(self) -> ast.PrimaryKeyTableConstraint:
-        # NOTE: Not to be confused with match_primary_key_constraint, which is for
-        # column-level constraints.
-        self.lexer.check(["PRIMARY"])
-        self.lexer.advance(expecting=["KEY"])
-
-        self.lexer.advance(expecting=[TokenType.LEFT_PARENTHESIS])
-        self.lexer.advance()
+        lexer = self.lexer
+        advance = lexer.advance
+        check = lexer.check
+        # NOTE: Column-level PRIMARY KEY constraints are parsed in match_column.
+        check(_EXPECT_PRIMARY)
+        advance(expecting=_EXPECT_KEY)
+
+        advance(expecting=_EXPECT_LEFT_PARENTHESIS)
+        advance()
         columns = self.match_identifier_list()
-        self.lexer.check([TokenType.RIGHT_PARENTHESIS])
+        check(_EXPECT_RIGHT_PARENTHESIS)
 
-        token = self.lexer.advance()
-        if token.value == "ON":
+        _, value = advance()
+        on_conflict: Optional[ast.OnConflict]
+        if value is _ON:
             on_conflict = self.match_on_conflict_clause()
         else:
             on_conflict = None
 
-        return ast.PrimaryKeyTableConstraint(columns=columns, on_conflict=on_conflict)
+        return ast.PrimaryKeyTableConstraint(columns, on_conflict)
 
     @debuggable
     def match_unique_table_constraint(self) -> ast.UniqueTableConstraint:
-        # NOTE: Not to be confused with match_unique_constraint, which is for
-        # column-level constraints.
-        self.lexer.check(["UNIQUE"])
-
-        self.lexer.advance(expecting=[TokenType.LEFT_PARENTHESIS])
-        self.lexer.advance()
+        lexer = self.lexer
+        advance = lexer.advance
+        check = lexer.check
+        # NOTE: Column-level UNIQUE constraints are parsed in match_column.
+        check(_EXPECT_UNIQUE)
+
+        advance(expecting=_EXPECT_LEFT_PARENTHESIS)
+        advance()
         columns = self.match_identifier_list()
-        self.lexer.check([TokenType.RIGHT_PARENTHESIS])
+        check(_EXPECT_RIGHT_PARENTHESIS)
 
-        token = self.lexer.advance()
-        if token.value == "ON":
+        _, value = advance()
+        on_conflict: Optional[ast.OnConflict]
+        if value is _ON:
             on_conflict = self.match_on_conflict_clause()
         else:
             on_conflict = None
 
-        return ast.UniqueTableConstraint(columns=columns, on_conflict=on_conflict)
+        return ast.UniqueTableConstraint(columns, on_conflict)
 
 
 
     @debuggable
     def match_check_constraint(self) -> ast.CheckConstraint:
-        self.lexer.check(["CHECK"])
-        self.lexer.advance(expecting=[TokenType.LEFT_PARENTHESIS])
-        start_index=self.lexer.index
-        self.lexer.advance()
+        lexer = self.lexer
+        advance = lexer.advance
+        check = lexer.check
+        check(_EXPECT_CHECK)
+        advance(expecting=_EXPECT_LEFT_PARENTHESIS)
+        start_index=lexer.following_index()
+        advance()
         expr = self.match_expression(verbatim=self.verbatim, start_index=start_index)
-        self.lexer.check([TokenType.RIGHT_PARENTHESIS])
-        self.lexer.advance()
+        check(_EXPECT_RIGHT_PARENTHESIS)
+        advance()
         return ast.CheckConstraint(expr)
 
-    @debuggable
-    def match_collate_constraint(self) -> ast.CollateConstraint:
-        self.lexer.check(["COLLATE"])
-        sequence = self.lexer.advance(
-            expecting=[
-                (TokenType.IDENTIFIER, "BINARY"),
-                (TokenType.IDENTIFIER, "NOCASE"),
-                (TokenType.IDENTIFIER, "RTRIM"),
-            ]
-        ).value
-        self.lexer.advance()
-        if sequence == "NOCASE":
-            return ast.CollateConstraint(ast.CollatingSequence.NOCASE)
-        elif sequence == "RTRIM":
-            return ast.CollateConstraint(ast.CollatingSequence.RTRIM)
-        elif sequence == "BINARY":
-            return ast.CollateConstraint(ast.CollatingSequence.BINARY)
-        else:
-            raise SQLiteParserImpossibleError(sequence)
-
-    @debuggable
-    def match_unique_constraint(self) -> ast.UniqueConstraint:
-        self.lexer.check(["UNIQUE"])
-        token = self.lexer.advance()
-        if (
-            token is not None
-            and token.type == TokenType.KEYWORD
-            and token.value == "ON"
-        ):
-            on_conflict = self.match_on_conflict_clause()
-        else:
-            on_conflict = None
-        return ast.UniqueConstraint(on_conflict=on_conflict)
-
     @debuggable
     def match_generated_column_constraint(self) -> ast.GeneratedColumnConstraint:
-        token = self.lexer.check(["GENERATED", "AS"])
-        if token.value == "GENERATED":
-            self.lexer.advance(expecting=["ALWAYS"])
-            self.lexer.advance(expecting=["AS"])
-
-        self.lexer.advance(expecting=[TokenType.LEFT_PARENTHESIS])
-        start_index=self.lexer.index
-        self.lexer.advance()
+        lexer = self.lexer
+        advance = lexer.advance
+        check = lexer.check
+        _, value = check(_EXPECT_GENERATED_OR_AS)
+        if value is _GENERATED:
+            advance(expecting=_EXPECT_ALWAYS)
+            advance(expecting=_EXPECT_AS)
+
+        advance(expecting=_EXPECT_LEFT_PARENTHESIS)
+        start_index=lexer.following_index()
+        advance()
         e = self.match_expression(verbatim=self.verbatim,start_index=start_index)
-        self.lexer.check([TokenType.RIGHT_PARENTHESIS])
+        check(_EXPECT_RIGHT_PARENTHESIS)
 
-        token = self.lexer.advance()
+        _, value = advance()
         storage: Optional[ast.GeneratedColumnStorage]
-        if token.value == "STORED":
+        if value == "STORED":
             storage = ast.GeneratedColumnStorage.STORED
-            self.lexer.advance()
-        elif token.value == "VIRTUAL":
+            advance()
+        elif value is _VIRTUAL:
             storage = ast.GeneratedColumnStorage.VIRTUAL
-            self.lexer.advance()
+            advance()
         else:
             storage = None
 
-        return ast.GeneratedColumnConstraint(e, storage=storage)
+        return ast.GeneratedColumnConstraint(e, storage)
 
     @debuggable
-    def match_default_clause(self) -> Union[ast.DefaultValue, ast.Node]:
-        self.lexer.check(["DEFAULT"])
-        token = self.lexer.advance(
-            expecting=[
-                TokenType.LEFT_PARENTHESIS,
-                TokenType.STRING,
-                TokenType.INTEGER,
-                TokenType.IDENTIFIER,
-                "NULL",
-                "CURRENT_TIME",
-                "CURRENT_DATE",
-                "CURRENT_TIMESTAMP",
-            ]
-        )
+    def match_default_clause(self) -> Union[ast.DefaultValue, ast.Expression]:
+        lexer = self.lexer
+        lexer.check(_EXPECT_DEFAULT)
+        token_type, value = lexer.advance(expecting=_EXPECT_DEFAULT_VALUE)
 
         # TODO(2021-05-05): Merge this with match_prefix?
-        if token.type == TokenType.LEFT_PARENTHESIS:
-            start_index=self.lexer.index
-            self.lexer.advance()
+        if token_type == TokenType.LEFT_PARENTHESIS:
+            start_index=lexer.following_index()
+            lexer.advance()
             e = self.match_expression(verbatim=self.verbatim, start_index=start_index)
-            self.lexer.check([TokenType.RIGHT_PARENTHESIS])
-            self.lexer.advance()
+            lexer.check(_EXPECT_RIGHT_PARENTHESIS)
+            lexer.advance()
             return e
-        elif token.type == TokenType.STRING:
-            self.lexer.advance()
-            return ast.String(token.value)
-        elif token.type == TokenType.BLOB:
-            self.lexer.advance()
-            return ast.Blob(token.value)
-        elif token.type == TokenType.INTEGER:
-            self.lexer.advance()
-            return ast.Integer(int(token.value))
-        elif token.type == TokenType.IDENTIFIER:
-            if token.value.upper() in ("TRUE", "FALSE"):
-                self.lexer.advance()
-                return ast.Boolean(token.value.upper() == "TRUE")
+        elif token_type == TokenType.STRING:
+            lexer.advance()
+            return ast.String(value)
+        elif token_type == TokenType.BLOB:
+            lexer.advance()
+            return ast.Blob(value)
+        elif token_type == TokenType.INTEGER:
+            lexer.advance()
+            return ast.Integer(int(value))
+        elif token_type == TokenType.IDENTIFIER:
+            if value.upper() in ("TRUE", "FALSE"):
+                lexer.advance()
+                return ast.Boolean(value.upper() == "TRUE")
             else:
                 raise SQLiteParserError
-        elif token.type == TokenType.KEYWORD:
-            self.lexer.advance()
-            if token.value == "NULL":
+        elif token_type == TokenType.KEYWORD:
+            lexer.advance()
+            if value is _NULL:
                 return ast.Null()
-            elif token.value == "CURRENT_TIME":
+            elif value is _CURRENT_TIME:
                 return ast.DefaultValue.CURRENT_TIME
-            elif token.value == "CURRENT_TIMESTAMP":
+            elif value is _CURRENT_TIMESTAMP:
                 return ast.DefaultValue.CURRENT_TIMESTAMP
-            elif token.value == "CURRENT_DATE":
+            elif value is _CURRENT_DATE:
                 return ast.DefaultValue.CURRENT_DATE
             else:
-                raise SQLiteParserImpossibleError(token.value)
+                raise SQLiteParserImpossibleError(value)
         else:
-            raise SQLiteParserImpossibleError(token.type)
+            raise SQLiteParserImpossibleError(token_type)
 
     @debuggable
     def match_on_conflict_clause(self) -> ast.OnConflict:
-        self.lexer.check(["ON"])
-        self.lexer.advance(expecting=["CONFLICT"])
-        strategy = self.lexer.advance(
-            expecting=["ROLLBACK", "ABORT", "FAIL", "IGNORE", "REPLACE"]
-        ).value
-        self.lexer.advance()
-        if strategy == "ROLLBACK":
-            return ast.OnConflict.ROLLBACK
-        elif strategy == "ABORT":
-            return ast.OnConflict.ABORT
-        elif strategy == "FAIL":
-            return ast.OnConflict.FAIL
-        elif strategy == "IGNORE":
-            return ast.OnConflict.IGNORE
-        elif strategy == "REPLACE":
-            return ast.OnConflict.REPLACE
-        else:
-            raise SQLiteParserImpossibleError(strategy)
+        lexer = self.lexer
+        advance = lexer.advance
+        lexer.check(_EXPECT_ON)
+        advance(expecting=_EXPECT_CONFLICT)
+        _, strategy = advance(expecting=_EXPECT_CONFLICT_STRATEGY)
+        advance()
+        return ast.OnConflict[strategy]
 
     @debuggable
-    def match_expression(self, precedence: int = -1, verbatim = False,start_index=0) -> Union[ast.Expression,ast.String]:
-        
+    def match_expression(
+        self, verbatim: bool = False, start_index: int = 0
+    ) -> ast.Expression:
+        lexer = self.lexer
+        advance = lexer.advance
         if verbatim:
+            # Skip to the end of the expression, which is a right parenthesis that
+            # closes an enclosing clause, the end of the statement, or the end of input,
+            # and return its source text.
             level = 0
-            prev_index=self.lexer.index
+            token_type, _ = lexer.current()
             while True:
-                      
-                if self.lexer.current_token.type == TokenType.RIGHT_PARENTHESIS:
-                    if level == 0:      
+                if token_type == TokenType.RIGHT_PARENTHESIS:
+                    if level == 0:
                         break
-                    else:
-                        level -= 1
-                        if level < 0:
-                            raise SQLiteParserError('unbalanced parenthesis')
-
-                elif self.lexer.current_token.type == TokenType.LEFT_PARENTHESIS:
-                    level += 1            
-                prev_index=self.lexer.index
-                self.lexer.advance()
-                if self.lexer.current_token.type == TokenType.SEMICOLON:     
-                    break  
-                if self.lexer.done() :
+                    level -= 1
+                elif token_type == TokenType.LEFT_PARENTHESIS:
+                    level += 1
+                elif token_type == TokenType.SEMICOLON or token_type == TokenType.EOF:
                     if level == 0:
                         break
-                    else:                
-                        raise SQLiteParserError('unbalanced parenthesis')
-            return ast.String(self.lexer.program[start_index:prev_index].rstrip())    
-
-        
-        left = self.match_prefix()
+                    raise SQLiteParserError("unbalanced parenthesis")
+                token_type, _ = advance()
+            end_index = lexer.starts[lexer.pos]
+            return ast.String(lexer.program[start_index:end_index].rstrip())
+
+        # Fast path for the most common shape of a whole expression, an identifier
+        # compared to a literal or another identifier, e.g. `age >= 18`.
+        pos = lexer.pos
+        types = lexer.types
+        precedences = lexer.precedences
+        p = precedences[pos + 1] if types[pos] == TokenType.IDENTIFIER else -1
+        if (
+            p >= 0
+            and p != FUNCTION_CALL_PRECEDENCE
+            and types[pos + 2] in SIMPLE_OPERAND_TYPES
+            and precedences[pos + 3] < 0
+        ):
+            values = lexer.values
+            right_type = types[pos + 2]
+            if right_type == TokenType.INTEGER:
+                right: ast.Expression = ast.Integer(int(values[pos + 2]))
+            else:
+                right = LITERAL_NODE_CLASSES[right_type](values[pos + 2])
+            lexer.pos = pos + 3
+            return ast.Infix(values[pos + 1], ast.Identifier(values[pos]), right)
+
+        # The expression is parsed with explicit stacks rather than by recursion. Each
+        # binary operator waits on the operator stack until an operator of the same or
+        # lower precedence arrives (or the expression ends), and is then folded with
+        # the top two operands into one.
+        operands = [self.match_prefix()]
+        # For each operand, the operator that it was folded from, if any.
+        folded_from: List[Optional[str]] = [None]
+        operators: List[str] = []
+        operator_precedences: List[int] = []
 
         while True:
-            token = self.lexer.current()
-            if token is None:
-                break
+            # Tokens that are not operators have a precedence of -1, which ends the
+            # expression after folding all the operators that are left.
+            p = precedences[lexer.pos]
+            while operator_precedences and operator_precedences[-1] >= p:
+                operator = operators.pop()
+                operator_precedences.pop()
+                right = operands.pop()
+                folded_from.pop()
+                left = operands[-1]
+                if folded_from[-1] is operator and isinstance(left, ast.InfixList):
+                    left.operands.append(right)
+                elif (
+                    folded_from[-1] is operator
+                    and operator in ASSOCIATIVE_OPERATORS
+                    and isinstance(left, ast.Infix)
+                ):
+                    operands[-1] = ast.InfixList(
+                        operator, [left.left, left.right, right]
+                    )
+                else:
+                    operands[-1] = ast.Infix(operator, left, right)
+                folded_from[-1] = operator
 
-            p = PRECEDENCE.get(token.value)
-            if p is None or precedence >= p:
+            if p < 0:
                 break
 
-            if token.value == "(":
-                if not isinstance(left, ast.Identifier):
+            if p == FUNCTION_CALL_PRECEDENCE:
+                # Nothing binds more tightly than a call, so it applies directly to the
+                # operand before it.
+                function = operands[-1]
+                if not isinstance(function, ast.Identifier):
                     raise SQLiteParserError("function must be an identifier")
 
-                next_token = self.lexer.advance()
-                if next_token.value == "*":
-                    self.lexer.advance(expecting=[TokenType.RIGHT_PARENTHESIS])
-                    self.lexer.advance()
-                    left = ast.Call(left, [], star=True, distinct=False)
-                elif next_token.value == "DISTINCT":
-                    self.lexer.advance()
+                _, value = advance()
+                if value is _STAR:
+                    advance(expecting=_EXPECT_RIGHT_PARENTHESIS)
+                    advance()
+                    operands[-1] = ast.Call(function, [], True, False)
+                elif value is _DISTINCT:
+                    advance()
                     arguments = self.match_expression_list()
-                    left = ast.Call(left, arguments, star=False, distinct=True)
+                    operands[-1] = ast.Call(function, arguments, False, True)
                 else:
                     arguments = self.match_expression_list()
-                    left = ast.Call(left, arguments, star=False, distinct=False)
+                    operands[-1] = ast.Call(function, arguments, False, False)
+                folded_from[-1] = None
             else:
-                left = self.match_infix(left, p)
-        return left
+                _, operator = lexer.current()
+                advance()
+                operators.append(operator)
+                operator_precedences.append(p)
+                operands.append(self.match_prefix())
+                folded_from.append(None)
 
-    @debuggable
-    def match_infix(self, left: ast.Expression, precedence: int) -> ast.Infix:
-        operator_token = self.lexer.current()
-        self.lexer.advance()
-        right = self.match_expression(precedence)
-        return ast.Infix(operator_token.value, left, right)
+        return operands[0]
 
     @debuggable
     def match_prefix(self) -> ast.Expression:
-        token = self.lexer.current()
-        if token.type == TokenType.IDENTIFIER:
-            self.lexer.advance()
-            return ast.Identifier(token.value)
-        elif token.type == TokenType.LEFT_PARENTHESIS:
-            self.lexer.advance()
+        lexer = self.lexer
+        token_type, value = lexer.current()
+        node_class = LITERAL_NODE_CLASSES.get(token_type)
+        if node_class is not None:
+            lexer.advance()
+            return node_class(value)
+        elif token_type == TokenType.LEFT_PARENTHESIS:
+            lexer.advance()
             values = self.match_expression_list()
             if len(values) == 1:
                 return values[0]
             else:
                 return ast.ExpressionList(values)
-        elif token.type == TokenType.STRING:
-            self.lexer.advance()
-            return ast.String(token.value)
-        elif token.type == TokenType.BLOB:
-            self.lexer.advance()
-            return ast.Blob(token.value)
-        elif token.type == TokenType.INTEGER:
-            self.lexer.advance()
-            return ast.Integer(int(token.value))
+        elif token_type == TokenType.INTEGER:
+            lexer.advance()
+            return ast.Integer(int(value))
         else:
-            raise SQLiteParserError(token.type, token.value)
+            raise SQLiteParserError(TokenType(token_type), value)
 
     def match_identifier_list(self) -> List[str]:
+        lexer = self.lexer
         identifiers = []
         while True:
-            token = self.lexer.current()
-            if token.type == TokenType.IDENTIFIER:
-                identifiers.append(token.value)
-                self.lexer.advance()
-            elif token.type == TokenType.COMMA:
-                self.lexer.advance()
+            token_type, value = lexer.current()
+            if token_type == TokenType.IDENTIFIER:
+                identifiers.append(value)
+                lexer.advance()
+            elif token_type == TokenType.COMMA:
+                lexer.advance()
             else:
                 break
         return identifiers
 
     def match_expression_list(self) -> List[ast.Expression]:
+        lexer = self.lexer
         expressions = []
         while True:
             e = self.match_expression()
             expressions.append(e)
-            token = self.lexer.check([TokenType.COMMA, TokenType.RIGHT_PARENTHESIS])
-            self.lexer.advance()
-            if token.type == TokenType.RIGHT_PARENTHESIS:
+            token_type, _ = lexer.check(_EXPECT_COMMA_OR_RIGHT_PARENTHESIS)
+            lexer.advance()
+            if token_type == TokenType.RIGHT_PARENTHESIS:
                 break
         return expressions
 
 
-# From https://sqlite.org/lang_expr.html
-PRECEDENCE = {
-    "OR": 0,
-    "AND": 1,
-    "=": 2,
-    "==": 2,
-    "!=": 2,
-    "<>": 2,
-    "IS": 2,
-    "IN": 2,
-    "LIKE": 2,
-    "GLOB": 2,
-    "MATCH": 2,
-    "REGEXP": 2,
-    "<": 3,
-    "<=": 3,
-    ">": 3,
-    ">=": 3,
-    "<<": 4,
-    ">>": 4,
-    "&": 4,
-    "|": 4,
-    "+": 5,
-    "-": 5,
-    "*": 6,
-    "/": 6,
-    "%": 6,
-    "||": 7,
-    "(": 8,
+# The AST node for each token type that match_prefix can wrap without converting the
+# token's value.
+LITERAL_NODE_CLASSES: Dict[int, Callable[[Any], ast.Expression]] = {
+    TokenType.IDENTIFIER: ast.Identifier,
+    TokenType.STRING: ast.String,
+    TokenType.BLOB: ast.Blob,
 }
+
+# The token types that the fast path in match_expression accepts as a right operand.
+SIMPLE_OPERAND_TYPES = frozenset([TokenType.INTEGER, *LITERAL_NODE_CLASSES])
+
+# Operators whose chains, e.g. a OR b OR c, match_expression folds into one InfixList.
+ASSOCIATIVE_OPERATORS = frozenset(["OR", "AND", "+", "*", "||"])
+
+# The precedence of the left parenthesis that begins a function call's arguments, which
+# no other operator shares.
+FUNCTION_CALL_PRECEDENCE = PRECEDENCE["("]
+
+
+class DebugParser(Parser):
+    """
+    A Parser that prints each match_XYZ call, and its return value, as it happens.
+    """
+
+
+for _name in DEBUGGABLE_METHODS:
+    setattr(DebugParser, _name, traced(getattr(Parser, _name)))
@@ -0,0 +1,14 @@
+import unittest
+
+import sqliteparser
+from sqliteparser import parser
+
+
+class CompiledTests(unittest.TestCase):
+    def test_compiled_reports_whether_parser_is_an_extension(self):
+        self.assertIsInstance(sqliteparser.COMPILED, bool)
+
+        if parser.__file__.endswith(".py"):
+            self.assertFalse(sqliteparser.COMPILED)
+        else:
+            self.assertTrue(sqliteparser.COMPILED)
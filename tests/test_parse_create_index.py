@@ -81,4 +81,17 @@ class ParseCreateTests(unittest.TestCase):
                     where= ast.String(value= "name is not null")
                 ),
             ],
-        )     
\ No newline at end of file
+        )
+
+    def test_parse_verbatim_expression_at_end_of_input(self):
+        self.assertEqual(
+            parse("CREATE INDEX idx ON people(name) WHERE age > 18", verbatim=True),
+            [
+                ast.CreateIndexStatement(
+                    name="idx",
+                    table="people",
+                    columns=["name"],
+                    where=ast.String("age > 18"),
+                ),
+            ],
+        )
@@ -1,4 +1,6 @@
 from tabnanny import verbose
+import contextlib
+import io
 import unittest
 
 from sqliteparser import ast, parse
@@ -1002,4 +1004,58 @@ class ParseCreateTests(unittest.TestCase):
                                 ],
                 ),
             ],
-        )
\ No newline at end of file
+        )
+
+    def test_parse_multiple_statements(self):
+        sql = """
+        CREATE TABLE a(x) WITHOUT ROWID, STRICT;
+        CREATE TABLE b(y);
+        CREATE INDEX idx ON b(y) WHERE y > 0;
+        CREATE TABLE c(z)
+        """
+        self.assertEqual(
+            parse(sql),
+            [
+                ast.CreateTableStatement(
+                    name="a",
+                    columns=[ast.Column(name="x", definition=None)],
+                    without_rowid=True,
+                    strict=True,
+                ),
+                ast.CreateTableStatement(
+                    name="b", columns=[ast.Column(name="y", definition=None)]
+                ),
+                ast.CreateIndexStatement(
+                    name="idx",
+                    table="b",
+                    columns=["y"],
+                    where=ast.Infix(">", ast.Identifier("y"), ast.Integer(0)),
+                ),
+                ast.CreateTableStatement(
+                    name="c", columns=[ast.Column(name="z", definition=None)]
+                ),
+            ],
+        )
+
+    def test_parse_empty_statements(self):
+        self.assertEqual(
+            parse("SELECT 1;;"), [ast.SelectStatement(columns=[ast.Integer(1)])]
+        )
+        self.assertEqual(
+            parse("; CREATE TABLE a(x);; ;"),
+            [
+                ast.CreateTableStatement(
+                    name="a", columns=[ast.Column(name="x", definition=None)]
+                )
+            ],
+        )
+        self.assertEqual(parse(";"), [])
+        self.assertEqual(parse("  ;  "), [])
+
+    def test_parse_with_debug_trace(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            statements = parse("SELECT 1", debug=True)
+
+        self.assertEqual(statements, [ast.SelectStatement(columns=[ast.Integer(1)])])
+        self.assertIn("match_statement", stdout.getvalue())
@@ -1,6 +1,7 @@
+import sys
 import unittest
 
-from sqliteparser import ast, parse
+from sqliteparser import SQLiteParserError, ast, parse
 
 
 class ParseExpressionTests(unittest.TestCase):
@@ -152,3 +153,146 @@ class ParseExpressionTests(unittest.TestCase):
                 )
             ],
         )
+
+    def test_parse_associative_chain(self):
+        self.assertEqual(
+            parse("SELECT a OR b OR c OR d"),
+            [
+                ast.SelectStatement(
+                    columns=[
+                        ast.InfixList(
+                            "OR",
+                            [
+                                ast.Identifier("a"),
+                                ast.Identifier("b"),
+                                ast.Identifier("c"),
+                                ast.Identifier("d"),
+                            ],
+                        )
+                    ]
+                )
+            ],
+        )
+
+    def test_parse_mixed_operator_chain(self):
+        self.assertEqual(
+            parse("SELECT 1 * 2 * 3 + 4 - 5"),
+            [
+                ast.SelectStatement(
+                    columns=[
+                        ast.Infix(
+                            "-",
+                            ast.Infix(
+                                "+",
+                                ast.InfixList(
+                                    "*",
+                                    [ast.Integer(1), ast.Integer(2), ast.Integer(3)],
+                                ),
+                                ast.Integer(4),
+                            ),
+                            ast.Integer(5),
+                        )
+                    ]
+                )
+            ],
+        )
+
+    def test_parse_mixed_precedence_chain(self):
+        self.assertEqual(
+            parse("SELECT a OR b AND c OR d"),
+            [
+                ast.SelectStatement(
+                    columns=[
+                        ast.InfixList(
+                            "OR",
+                            [
+                                ast.Identifier("a"),
+                                ast.Infix(
+                                    "AND", ast.Identifier("b"), ast.Identifier("c")
+                                ),
+                                ast.Identifier("d"),
+                            ],
+                        )
+                    ]
+                )
+            ],
+        )
+
+    def test_parse_long_chain_without_deep_recursion(self):
+        # Each group climbs through every binary precedence level.
+        n = 500
+        program = "SELECT " + " OR ".join(
+            f"a{i} AND b{i} = c{i} < d{i} + e{i} * f{i} || g{i}" for i in range(n)
+        )
+
+        def group(i):
+            operands = [ast.Identifier(f"{name}{i}") for name in "abcdefg"]
+            e = operands.pop()
+            for operator in ["||", "*", "+", "<", "=", "AND"]:
+                e = ast.Infix(operator, operands.pop(), e)
+            return e
+
+        expected = [
+            ast.SelectStatement(
+                columns=[ast.InfixList("OR", [group(i) for i in range(n)])]
+            )
+        ]
+
+        # Find the lowest recursion limit under which a short expression parses, and
+        # check that the long chain parses under it too, i.e. that the parser's stack
+        # depth depends on neither the length of the chain nor its precedence levels.
+        limit = sys.getrecursionlimit()
+        try:
+            for low_limit in range(1, limit):
+                try:
+                    # Raises RecursionError if the limit is below the current depth.
+                    sys.setrecursionlimit(low_limit)
+                    parse("SELECT 1 + 2 + 3")
+                except RecursionError:
+                    continue
+                break
+
+            statements = parse(program)
+        finally:
+            sys.setrecursionlimit(limit)
+
+        self.assertEqual(statements, expected)
+
+    def test_parenthesized_chain_is_not_flattened(self):
+        self.assertEqual(
+            parse("SELECT (1 + 2) + 3"),
+            [
+                ast.SelectStatement(
+                    columns=[
+                        ast.Infix(
+                            "+",
+                            ast.Infix("+", ast.Integer(1), ast.Integer(2)),
+                            ast.Integer(3),
+                        )
+                    ]
+                )
+            ],
+        )
+
+    def test_parse_comparison_with_function_call(self):
+        self.assertEqual(
+            parse("SELECT x = f(1)"),
+            [
+                ast.SelectStatement(
+                    columns=[
+                        ast.Infix(
+                            "=",
+                            ast.Identifier("x"),
+                            ast.Call(ast.Identifier("f"), [ast.Integer(1)]),
+                        )
+                    ]
+                )
+            ],
+        )
+
+    def test_quoted_operator_is_not_an_operator(self):
+        with self.assertRaises(SQLiteParserError):
+            parse("SELECT 1 '+' 2")
+
+        with self.assertRaises(SQLiteParserError):
+            parse('SELECT 1 "AND" 2')